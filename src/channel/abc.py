@@ -30,6 +30,7 @@
 
 """Module containing the ChannelMetaclass class."""
 
+from sys import intern
 from typing import Any
 
 
@@ -42,8 +43,16 @@ class ChannelMetaclass(type):
     ) -> type:
         new_cls = super().__new__(cls, name, bases, attrs)
         new_cls.subscribers = set()
+        new_cls.subscriber_ids = set()
 
-        if not new_cls.name:
-            new_cls.name = name.lower()
+        # Names and permissions are interned, as they're used as keys
+        # and compared often.
+        new_cls.name = intern(new_cls.name or name.lower())
+        new_cls.permissions = intern(new_cls.permissions)
+
+        alias = new_cls.alias
+        if isinstance(alias, str):
+            alias = (alias,)
+        new_cls._all_names = (new_cls.name, *map(intern, alias))
 
         return new_cls
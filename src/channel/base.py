@@ -37,7 +37,8 @@ can also be altered.
 
 """
 
-from typing import Sequence, TYPE_CHECKING
+from sys import intern
+from typing import Sequence, Type, TYPE_CHECKING
 
 from channel.abc import ChannelMetaclass
 from command.base import Command
@@ -82,42 +83,103 @@ class Channel(metaclass=ChannelMetaclass):
 
         return True
 
+    @classmethod
+    def has_subscriber(cls, character: "Character") -> bool:
+        """Return whether this character is subscribed to this channel.
+
+        Membership is tested on character IDs, which is much faster
+        than hashing the character model itself.
+
+        Args:
+            character (Character): the character to test.
+
+        """
+        return character.id in cls.subscriber_ids
+
+    @classmethod
+    def add_subscriber(cls, character: "Character") -> bool:
+        """Add a subscriber to this channel.
+
+        Args:
+            character (Character): the character to add.
+
+        Returns:
+            added (bool): whether the character wasn't subscribed before.
+
+        """
+        if character.id in cls.subscriber_ids:
+            return False
+
+        cls.subscriber_ids.add(character.id)
+        cls.subscribers.add(character)
+        return True
+
+    @classmethod
+    def remove_subscriber(cls, character: "Character") -> bool:
+        """Remove a subscriber from this channel.
+
+        Args:
+            character (Character): the character to remove.
+
+        Returns:
+            removed (bool): whether the character was subscribed before.
+
+        """
+        if character.id not in cls.subscriber_ids:
+            return False
+
+        cls.subscriber_ids.discard(character.id)
+        cls.subscribers.discard(character)
+        return True
+
     @classmethod
     def create_commands(cls):
         """Create the commands for this channel."""
-        names = [cls.name]
-        alias = cls.alias
-        if isinstance(alias, str):
-            names.append(alias)
-        else:
-            names.extend(alias)
-
-        for name in names:
+        commands = {}
+        for name in cls._all_names:
+            capitalized = name.capitalize()
             if not cls.always_on:
-                join = type(
-                    f"Join{name.capitalize()}",
-                    (JoinChannel,),
-                    dict(channel=cls),
+                commands[intern(f"+join_{name}")] = cls._make_command(
+                    JoinChannel, f"Join{capitalized}", f"+{name}"
                 )
-                join.name = f"+{name}"
-                join.permissions = cls.permissions
-                Command.service.commands[f"+join_{name}"] = join
-
-                leave = type(
-                    f"Leave{name.capitalize()}",
-                    (LeaveChannel,),
-                    dict(channel=cls),
+                commands[intern(f"+leave_{name}")] = cls._make_command(
+                    LeaveChannel, f"Leave{capitalized}", f"-{name}"
                 )
-                leave.name = f"-{name}"
-                leave.permissions = cls.permissions
-                Command.service.commands[f"+leave_{name}"] = leave
 
-            use = type(
-                f"Use{name.capitalize()}", (UseChannel,), dict(channel=cls)
+            commands[intern(f"+use_{name}")] = cls._make_command(
+                UseChannel, f"Use{capitalized}", name
             )
-            use.name = name
-            use.permissions = cls.permissions
-            Command.service.commands[f"+use_{name}"] = use
+
+        Command.service.add_commands(commands)
+
+    @classmethod
+    def _make_command(
+        cls, base: Type[Command], class_name: str, name: str
+    ) -> Type[Command]:
+        """Create a command class for this channel.
+
+        The class attributes are given to `type` directly, so the
+        command metaclass runs once with the final class namespace.
+
+        Args:
+            base (subclass of Command): the command base class.
+            class_name (str): the name of the class to create.
+            name (str): the command name.
+
+        Returns:
+            command (subclass of Command): the new command class.
+
+        """
+        return type(
+            class_name,
+            (base,),
+            dict(
+                channel=cls,
+                name=intern(name),
+                permissions=cls.permissions,
+                __slots__=(),
+            ),
+        )
 
     @classmethod
     def msg_from(cls, character: "Character", message: str):
@@ -128,10 +190,12 @@ class Channel(metaclass=ChannelMetaclass):
             message (str: the message to be sent.
 
         """
+        prefix = f"[{cls.name}] "
+        self_line = f"{prefix}Vous dites : {message}"
+        other_line = f"{prefix}{character.name} dit : {message}"
+        pairs = []
         for subscriber in cls.subscribers:
-            if subscriber is character:
-                subscriber.msg(f"[{cls.name}] Vous dites : {message}")
-            else:
-                subscriber.msg(
-                    f"[{cls.name}] {character.name} dit : {message}"
-                )
+            line = self_line if subscriber is character else other_line
+            pairs.append((subscriber, line))
+
+        cls.service.broadcast(pairs)
@@ -30,8 +30,11 @@
 
 """Module containing the CommandMetaclass class."""
 
+import inspect
+from textwrap import dedent
 from typing import Any
 
+from command.args import CommandArgs
 from data.decorators import lazy_property
 
 
@@ -44,25 +47,119 @@ class CommandMetaclass(type):
     ) -> type:
         new_cls = super().__new__(cls, name, bases, attrs)
         new_cls.sub_commands = set()
+        new_cls._sub_commands_tuple = None
+        new_cls._sub_commands_width = None
+        new_cls._resolved_sep = cls._resolve_sep(getattr(new_cls, "seps", ""))
+        new_cls._seps = cls._as_tuple(getattr(new_cls, "seps", ()))
+        new_cls._aliases = cls._as_tuple(getattr(new_cls, "alias", ()))
+        new_cls._global_aliases = cls._as_tuple(
+            getattr(new_cls, "global_alias", ())
+        )
         if parent := new_cls.parent:
             parent.sub_commands.add(new_cls)
+            parent._sub_commands_tuple = None
+            parent._sub_commands_width = None
+
+        # Expand the parser defined in the class body right away,
+        # so the first use of the command doesn't have to.
+        if isinstance(args := attrs.get("args"), CommandArgs):
+            args.prepare()
 
         return new_cls
 
+    @property
+    def iter_sub_commands(cls) -> tuple[type, ...]:
+        """Return the sub-commands as a tuple, sorted by name.
+
+        The tuple is built on first access and cached until
+        a new sub-command is registered.  Sorting it keeps the
+        order of sub-commands stable in listings.
+
+        """
+        sub_commands = cls._sub_commands_tuple
+        if sub_commands is None:
+            sub_commands = cls._sub_commands_tuple = tuple(
+                sorted(cls.sub_commands, key=lambda sub: sub.name)
+            )
+
+        return sub_commands
+
+    @property
+    def sub_commands_width(cls) -> int:
+        """Return the length of the longest sub-command name.
+
+        The width is cached until a new sub-command is registered.
+
+        """
+        width = cls._sub_commands_width
+        if width is None:
+            width = cls._sub_commands_width = max(
+                (len(sub.name) for sub in cls.iter_sub_commands), default=0
+            )
+
+        return width
+
     @lazy_property
     def full_name(cls) -> str:
         """Return the command's full name."""
-        name = ""
-        if parent := cls.parent:
-            name = parent.full_name
-            sep = parent.seps
-            if isinstance(sep, tuple):
-                if sep:
-                    sep = sep[0]
+        parts = [cls.name]
+        parent = cls.parent
+        while parent:
+            parts.append(parent._resolved_sep)
+            parts.append(parent.name)
+            parent = parent.parent
+
+        parts.reverse()
+        return "".join(parts)
+
+    @lazy_property
+    def db_prefix(cls) -> str:
+        """Return the prefix of this command's keys in `character.db`.
+
+        The prefix depends on the command's Python path (`pyname`),
+        set when commands are loaded, and is computed once per class.
+
+        """
+        pyname = cls.pyname.replace(".", "_")
+        return f"_command_{pyname}_"
+
+    @lazy_property
+    def help_text(cls) -> str:
+        """Return the command's help, inferred from its docstring.
+
+        The docstring is retrieved and dedented only once per class.
+
+        """
+        return dedent(inspect.getdoc(cls))
+
+    @staticmethod
+    def _resolve_sep(sep: str | tuple[str]) -> str:
+        """Return the separator placed after a command in its full name.
+
+        Args:
+            sep (str or tuple): the command separators.
+
+        Returns:
+            sep (str): the first separator, or an empty string.
+
+        """
+        if isinstance(sep, tuple):
+            sep = sep[0] if sep else ""
+
+        return sep if isinstance(sep, str) else ""
+
+    @staticmethod
+    def _as_tuple(names: str | tuple[str]) -> tuple[str, ...]:
+        """Return the given name or names as a tuple.
+
+        Args:
+            names (str or tuple): a single name or a tuple of names.
 
-            if not isinstance(sep, str):
-                sep = ""
+        Returns:
+            names (tuple): the names as a tuple (possibly empty).
 
-            name += sep
+        """
+        if not names:
+            return ()
 
-        return f"{name}{cls.name}"
+        return (names,) if isinstance(names, str) else tuple(names)
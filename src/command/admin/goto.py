@@ -27,6 +27,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 # OF THE POSSIBILITY OF SUCH DAMAGE.
 
+from functools import cached_property
+
 from command import Command
 from data.room import Room
 
@@ -74,23 +76,36 @@ class Goto(Command):
     destination = group.add_branch("move")
     destination.add_argument("word", dest="destination")
 
+    @cached_property
+    def aliases(self) -> dict[str, str]:
+        """Return the goto aliases of this character.
+
+        Reading the aliases doesn't write to the character namespace.
+        Methods modifying aliases should store them back explicitly.
+
+        """
+        return self.db.get("aliases", {})
+
     def list_aliases(self):
         """List the current aliases."""
-        aliases = self.db.setdefault("aliases", {})
+        aliases = self.aliases
         if not aliases:
             self.msg("You don't have any goto alias yet.")
             return
 
-        max_key = max(len(key) for key in aliases.keys())
-        aliases = sorted(aliases.items())
+        max_key = max(map(len, aliases))
         lines = ["Your current goto aliases:"]
-        for key, alias in aliases:
-            lines.append(f"  {key:<{max_key}}: {alias}")
+        lines.extend(
+            [
+                f"  {key.ljust(max_key)}: {alias}"
+                for key, alias in sorted(aliases.items())
+            ]
+        )
         self.msg("\n".join(lines))
 
     def add_alias(self, destination: str):
         """Add an alias."""
-        aliases = self.db.setdefault("aliases", {})
+        aliases = self.aliases
         room = self.character.location
         if room is None:
             self.msg("You aren't in any room yet.")
@@ -105,7 +120,7 @@ class Goto(Command):
 
     def del_alias(self, destination: str):
         """Remove an alias."""
-        aliases = self.db.setdefault("aliases", {})
+        aliases = self.aliases
         if aliases.pop(destination.lower(), None) is None:
             self.msg(
                 f"This goto alias {destination} isn't defined "
@@ -118,17 +133,22 @@ class Goto(Command):
 
     def move(self, destination):
         """Command body."""
-        aliases = self.db.setdefault("aliases", {})
+        aliases = self.aliases
+        key = destination.lower()
         room = None
 
         # First, test room barcodes.
-        room = Room.get(barcode=destination.lower(), raise_not_found=False)
+        room = Room.get(barcode=key, raise_not_found=False)
 
         if room is None:
             # Maybe it's an alias.
-            barcode = aliases.get(destination.lower())
+            barcode = aliases.get(key)
             if barcode:
-                room = Room.get(barcode=barcode, raise_not_found=False)
+                # An alias pointing to the barcode we just tried
+                # doesn't need a second lookup.
+                if barcode != key:
+                    room = Room.get(barcode=barcode, raise_not_found=False)
+
                 if room is None:
                     self.msg(
                         f"The goto alias {destination} is linked to room "
@@ -97,6 +97,8 @@ class CommandArgs:
     def __init__(self):
         self.arguments = []
         self.msg_invalid = "Invalid syntax."
+        self._possibilities = None
+        self._format = None
 
     def new(
         self,
@@ -152,14 +154,52 @@ class CommandArgs:
             arg_type, *args, dest=dest, optional=optional, **kwargs
         )
         self.arguments.append(argument)
+        self.invalidate()
         return argument
 
     def add_group(self, role):
         """Add an argument group."""
         group = Group(self, role)
         self.arguments.append(group)
+        self.invalidate()
         return group
 
+    def invalidate(self) -> None:
+        """Invalidate the cached possibilities and format.
+
+        This method should be called whenever the arguments
+        (or the branches of a group) are modified.
+
+        """
+        self._possibilities = None
+        self._format = None
+
+    @property
+    def possibilities(self) -> list[list[Argument]]:
+        """Return the expanded possibilities, computing them if needed."""
+        possibilities = self._possibilities
+        if possibilities is None:
+            possibilities = self.prepare()
+
+        return possibilities
+
+    def prepare(self) -> list[list[Argument]]:
+        """Expand the arguments into possibilities and cache them.
+
+        This is done automatically when parsing, but can be called
+        beforehand, so the first parse doesn't have to.
+
+        Returns:
+            possibilities (list of list of arguments): the possibilities.
+
+        """
+        possibilities = [[]]
+        for arg in self.arguments:
+            possibilities = arg.expand(possibilities)
+
+        self._possibilities = possibilities
+        return possibilities
+
     def format(self) -> str:
         """Return a string description of the arguments.
 
@@ -170,16 +210,16 @@ class CommandArgs:
             description (str): the formatted text.
 
         """
-        possibilities = [[]]
-        for arg in self.arguments:
-            possibilities = arg.expand(possibilities)
+        text = self._format
+        if text is None:
+            text = self._format = "\n".join(
+                [
+                    " ".join([arg.format() for arg in line])
+                    for line in self.possibilities
+                ]
+            )
 
-        return "\n".join(
-            [
-                " ".join([arg.format() for arg in line])
-                for line in possibilities
-            ]
-        )
+        return text
 
     def parse(
         self,
@@ -203,10 +243,11 @@ class CommandArgs:
             result (`Namespace` or `ArgumentError`): the parsed result.
 
         """
-        possibilities = [[]]
-        for arg in self.arguments:
-            possibilities = arg.expand(possibilities)
-
         return parse_possibilities(
-            possibilities, character, string, begin, end, self.msg_invalid
+            self.possibilities,
+            character,
+            string,
+            begin,
+            end,
+            self.msg_invalid,
         )
@@ -30,6 +30,9 @@
 """Base argument."""
 
 from enum import Enum
+import re
+from sys import intern
+from types import MappingProxyType
 from typing import Optional, Union, TYPE_CHECKING
 
 from command.args.error import ArgumentError
@@ -38,7 +41,13 @@ from command.args.result import Result
 if TYPE_CHECKING:
     from data.character import Character
 
-ARG_TYPES = {}
+# Argument types, registered when argument classes are defined.
+# ARG_TYPES is a read-only view on this dictionary.
+_ARG_TYPES = {}
+ARG_TYPES = MappingProxyType(_ARG_TYPES)
+
+# Find the next space character (the scan runs in C).
+_NEXT_SPACE = re.compile(r"\s").search
 
 
 class ArgSpace(Enum):
@@ -50,16 +59,7 @@ class ArgSpace(Enum):
     WORD = 3  # The command will capture the first word
 
 
-class ArgMeta(type):
-
-    """Metaclass for arguments."""
-
-    def __init__(cls, name, bases, cls_dict):
-        if cls.name:
-            ARG_TYPES[cls.name] = cls
-
-
-class Argument(metaclass=ArgMeta):
+class Argument:
 
     """Base class for arguments."""
 
@@ -69,6 +69,13 @@ class Argument(metaclass=ArgMeta):
 
     # To not override.
     _NOT_SET = None
+    _formatted = None
+    _mandatory = (None, "")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.name:
+            _ARG_TYPES[intern(cls.name)] = cls
 
     def __init__(self, dest, optional=False, default=None, **kwargs):
         self.dest = dest
@@ -80,6 +87,22 @@ class Argument(metaclass=ArgMeta):
     def has_default(self):
         return self.default is not self._NOT_SET
 
+    @property
+    def mandatory_message(self) -> str:
+        """Return the error message if this argument is missing.
+
+        The message is formatted once and cached, as long as
+        `msg_mandatory` isn't modified.
+
+        """
+        template, message = self._mandatory
+        if template is not self.msg_mandatory:
+            template = self.msg_mandatory
+            message = template.format(argument=self.name)
+            self._mandatory = (template, message)
+
+        return message
+
     def __repr__(self):
         return f"<Arg {self.name}>"
 
@@ -90,10 +113,14 @@ class Argument(metaclass=ArgMeta):
             description (str): the formatted text.
 
         """
-        text = f"<{self.dest}>"
+        text = self._formatted
+        if text is None:
+            text = f"<{self.dest}>"
+
+            if self.optional:
+                text = f"[{text}]"
 
-        if self.optional:
-            text = f"[{text}]"
+            self._formatted = text
 
         return text
 
@@ -107,7 +134,7 @@ class Argument(metaclass=ArgMeta):
 
         """
         for possible in possibilities:
-            possible += [self]
+            possible.append(self)
 
         return possibilities
 
@@ -131,13 +158,11 @@ class Argument(metaclass=ArgMeta):
 
         """
         if type(self).space is ArgSpace.WORD:
-            space_pos = string.find(" ", begin)
-            if space_pos != -1:
-                end = space_pos
+            end = len(string) if end is None else end
+            if match := _NEXT_SPACE(string, begin, end):
+                end = match.start()
 
-            return Result(begin=begin, end=end, string=string)
-        else:
-            return Result(begin=begin, end=end, string=string)
+        return Result(begin=begin, end=end, string=string)
 
     def add_to_namespace(self, result, namespace):
         """Add the parsed search object to the namespace."""
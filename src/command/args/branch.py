@@ -94,6 +94,7 @@ class Branch:
             *args, dest=dest, optional=optional, default=default, **kwargs
         )
         self._args.arguments.append(argument)
+        self._args.invalidate()
         return argument
 
     def parse(
@@ -29,7 +29,7 @@
 
 """Argument group, containing branches."""
 
-from itertools import permutations, product
+from itertools import chain, permutations, product
 
 from command.args.base import Argument, ArgSpace
 
@@ -67,6 +67,8 @@ class Group:
                 f"are {list(ROLES)}"
             )
         self.role = role
+        self._combinations = None
+        self._formatted = None
 
     def add_branch(self, *args, run_in: str = "run") -> None:
         """Add and fill a branch.
@@ -83,6 +85,10 @@ class Group:
         for arg in args:
             arg.run_in = run_in
 
+        self._combinations = None
+        self._formatted = None
+        self.parser.invalidate()
+
     def format(self):
         """Return a string description of the arguments.
 
@@ -90,6 +96,10 @@ class Group:
             description (str): the formatted text.
 
         """
+        text = self._formatted
+        if text is not None:
+            return text
+
         if len(self.branches) > 1:
             text = "("
             text += f") {self.role} (".join(
@@ -102,6 +112,7 @@ class Group:
         else:
             text = " ".join([arg.format() for arg in self.branches[0]])
 
+        self._formatted = text
         return text
 
     def expand(self, possibilities: list[list["Argument"]]) -> None:
@@ -120,11 +131,13 @@ class Group:
             ]
         elif self.role == "+":
             # Several branches can be used.
-            branches = [
-                sum(cb, [])
-                for r in range(len(self.branches) + 1)
-                for cb in permutations(self.branches, r)
-            ]
+            branches = self._combinations
+            if branches is None:
+                branches = self._combinations = [
+                    list(chain.from_iterable(cb))
+                    for r in range(len(self.branches) + 1)
+                    for cb in permutations(self.branches, r)
+                ]
 
             possibilities = [
                 old + new for old, new in product(possibilities, branches)
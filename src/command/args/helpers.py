@@ -10,6 +10,7 @@ Functions:
 
 """
 
+import re
 from typing import Optional, Sequence, Union, TYPE_CHECKING
 
 from command.args.base import ArgSpace, Argument
@@ -20,6 +21,9 @@ from command.args.result import DefaultResult, Result
 if TYPE_CHECKING:
     from data.character import Character
 
+# Find the next non-space character (the scan runs in C).
+_NEXT_NON_SPACE = re.compile(r"\S").search
+
 
 def parse_possibilities(
     possibilities: list[list[Argument]],
@@ -46,18 +50,25 @@ def parse_possibilities(
         result (Namespace or ArgumentError): the parsed result.
 
     """
-    results = [
-        parse_all(arguments, character, string, begin, end)
-        for arguments in possibilities
-    ]
-    successes = [result for result in results if isinstance(result, Namespace)]
-    if successes:
-        lines = zip(results, possibilities)
-        lines = [tup for tup in lines if tup[0]]
-        result, _ = max(
-            lines, key=lambda tup: len([a for a in tup[1] if not a.optional])
-        )
-    else:
+    # Most commands only have one possibility.
+    if len(possibilities) == 1:
+        result = parse_all(possibilities[0], character, string, begin, end)
+        if isinstance(result, Namespace):
+            return result
+
+        return ArgumentError(syntax_error)
+
+    # Keep the first success with the most mandatory arguments.
+    result = None
+    best = -1
+    for arguments in possibilities:
+        parsed = parse_all(arguments, character, string, begin, end)
+        if isinstance(parsed, Namespace):
+            mandatory = sum(1 for arg in arguments if not arg.optional)
+            if mandatory > best:
+                result, best = parsed, mandatory
+
+    if result is None:
         result = ArgumentError(syntax_error)
 
     return result
@@ -86,13 +97,18 @@ def parse_all(
     """
     results = [None] * len(arguments)
 
-    # Parse arguments with definite size.
-    results = parse_strict_arguments(
-        arguments, results, character, string, begin, end
-    )
-    results = parse_word_arguments(
-        arguments, results, character, string, begin, end
-    )
+    # Parse arguments with definite size, skipping the passes
+    # for which no argument has the right space.
+    spaces = {arg.space for arg in arguments}
+    if ArgSpace.STRICT in spaces:
+        results = parse_strict_arguments(
+            arguments, results, character, string, begin, end
+        )
+
+    if ArgSpace.WORD in spaces:
+        results = parse_word_arguments(
+            arguments, results, character, string, begin, end
+        )
 
     # Now parse the remiaining ones.
     results = parse_unknown_arguments(
@@ -101,15 +117,9 @@ def parse_all(
 
     # If an error has occurred, return the first
     # mandatory argument error.
-    errors = [result for result in results if not result]
-    if errors:
-        mandatory = [
-            result
-            for result in errors
-            if not arguments[results.index(result)].optional
-        ]
-        if mandatory:
-            return mandatory[0]
+    for arg, result in zip(arguments, results):
+        if not result and not arg.optional:
+            return result
 
     # Check that the string has been entirely parsed.
     if not has_entirely_parsed(results, string, begin, end):
@@ -122,7 +132,7 @@ def parse_all(
 
 def parse_strict_arguments(
     arguments: Sequence[Argument],
-    results: Sequence[Result],
+    results: list[Result],
     character: "Character",
     string: str,
     begin: int,
@@ -142,17 +152,17 @@ def parse_strict_arguments(
         results (sequence of Result): the parsed results (same length).
 
     Warning: the length of arguments and results should be equal.
+    The results list is modified in place and returned.
 
     """
-    arguments = [
-        arg if arg.space is ArgSpace.STRICT else None for arg in arguments
-    ]
-    return parse_arguments(arguments, results, character, string, begin, end)
+    return parse_arguments(
+        arguments, results, character, string, begin, end, ArgSpace.STRICT
+    )
 
 
 def parse_word_arguments(
     arguments: Sequence[Argument],
-    results: Sequence[Result],
+    results: list[Result],
     character: "Character",
     string: str,
     begin: int,
@@ -172,17 +182,17 @@ def parse_word_arguments(
         results (sequence of Result): the parsed results (same length).
 
     Warning: the length of arguments and results should be equal.
+    The results list is modified in place and returned.
 
     """
-    arguments = [
-        arg if arg.space is ArgSpace.WORD else None for arg in arguments
-    ]
-    return parse_arguments(arguments, results, character, string, begin, end)
+    return parse_arguments(
+        arguments, results, character, string, begin, end, ArgSpace.WORD
+    )
 
 
 def parse_unknown_arguments(
     arguments: Sequence[Argument],
-    results: Sequence[Result],
+    results: list[Result],
     character: "Character",
     string: str,
     begin: int,
@@ -202,86 +212,84 @@ def parse_unknown_arguments(
         results (sequence of Result): the parsed results (same length).
 
     Warning: the length of arguments and results should be equal.
+    The results list is modified in place and returned.
 
     """
     return parse_arguments(arguments, results, character, string, begin, end)
 
 
 def parse_arguments(
-    arguments: Sequence[Optional[Argument]],
-    results: Sequence[Result],
+    arguments: Sequence[Argument],
+    results: list[Result],
     character: "Character",
     string: str,
     begin: int,
     end: Optional[int] = None,
+    space: Optional[ArgSpace] = None,
 ) -> Sequence[Result]:
-    """Only parse the provided arguments.
+    """Only parse the arguments with the given space.
 
     Args:
-        arguments (sequence of Argument and None): the arguments.
+        arguments (sequence of Argument): the arguments.
         results (Sequence of Result): the already-parsed results.
         character (Character): the character parsing these arguments.
         string (str): the string to parse.
         begin (int): the beginning of the string to parse.
         end (int, optional): the end of the string to parse.
+        space (ArgSpace, optional): only parse arguments with this
+                space.  If not set, parse all arguments.
 
     Returns:
         results (Sequence of Result): the parsed results (same length).
 
     Warning: the length of arguments and results should be equal.
+    The results list is modified in place and returned.
 
     """
-    results = list(results)
     end = len(string) if end is None else end
-    for i, arg in enumerate(arguments):
-        if arg is None:
-            continue
 
-        if results[i] is not None:
-            continue
+    # Find the beginning of the following result for each argument,
+    # scanning the results only once from right to left.
+    next_begins = [end] * len(results)
+    next_begin = end
+    for i in range(len(results) - 1, -1, -1):
+        next_begins[i] = next_begin
+        if result := results[i]:
+            next_begin = result.begin
 
-        # If there's a previous result, parse after it.
-        t_begin = begin
-        if i > 0:
-            prev_results = [result for result in results[:i] if result]
-            if prev_results:
-                prev_result = prev_results[-1]
-                t_begin = prev_result.end
-
-        # Skip over spaces.
-        while t_begin < len(string):
-            if string[t_begin].isspace():
-                t_begin += 1
-            else:
-                break
+    prev_end = begin
+    for i, arg in enumerate(arguments):
+        if results[i] is None and (space is None or arg.space is space):
+            # If there's a previous result, parse after it.
+            t_begin = prev_end
 
-        # If there's a following result, parse before it.
-        t_end = end
-        if i < len(arguments) - 1:
-            next_results = [result for result in results[i + 1 :] if result]
-            if next_results:
-                next_result = next_results[0]
-                t_end = next_result.begin
-
-        # Skip over spaces.
-        while t_end - 1 > t_begin:
-            if string[t_end - 1].isspace():
-                t_end -= 1
+            # Skip over spaces.
+            if match := _NEXT_NON_SPACE(string, t_begin):
+                t_begin = match.start()
             else:
+                t_begin = max(t_begin, len(string))
+
+            # If there's a following result, parse before it.
+            t_end = next_begins[i]
+
+            # Skip over spaces (the first character is always kept).
+            if t_end - 1 > t_begin:
+                t_end = t_begin + 1 + len(string[t_begin + 1 : t_end].rstrip())
+
+            if t_begin >= t_end and not arg.optional:
+                results[i] = ArgumentError(arg.mandatory_message)
                 break
 
-        if t_begin >= t_end and not arg.optional:
-            results[i] = ArgumentError(
-                arg.msg_mandatory.format(argument=arg.name)
-            )
-            break
+            result = arg.parse(character, string, t_begin, t_end)
+            if not result:
+                if arg.optional and arg.has_default:
+                    result = DefaultResult(arg.default)
 
-        result = arg.parse(character, string, t_begin, t_end)
-        if not result:
-            if arg.optional and arg.has_default:
-                result = DefaultResult(arg.default)
+            results[i] = result
 
-        results[i] = result
+        # Following arguments are parsed after the last result.
+        if result := results[i]:
+            prev_end = result.end
 
     return results
 
@@ -309,26 +317,28 @@ def has_entirely_parsed(
     if end is None:
         end = len(string)
 
-    indices = list(range(begin, end))
+    # One byte per parsed position, set to 1 when covered by a result.
+    covered = bytearray(max(end - begin, 0))
     for result in results:
         if not result:
             continue
 
         r_begin = result.begin
         r_end = result.end
-        r_begin = 0 if r_begin is None else r_begin
-        r_end = len(string) if r_end is None else r_end
-        for i in range(r_begin, r_end):
-            if i in indices:
-                indices.remove(i)
+        r_begin = begin if r_begin is None else max(r_begin, begin)
+        r_end = end if r_end is None else min(r_end, end)
+        if r_begin < r_end:
+            covered[r_begin - begin : r_end - begin] = b"\x01" * (
+                r_end - r_begin
+            )
 
-    # Remove spaces in unprocessed indices.
-    for i in tuple(indices):
-        if string[i].isspace():
-            indices.remove(i)
+    # Unprocessed positions are only allowed to be spaces.
+    pos = covered.find(0)
+    while pos != -1:
+        if not string[begin + pos].isspace():
+            return False
 
-    if indices:
-        return False
+        pos = covered.find(0, pos + 1)
 
     return True
 
@@ -349,28 +359,31 @@ def create_namespace(
 
     """
     namespace = Namespace()
-    methods = set()
+    method = None
     for arg, result in zip(arguments, results):
-        methods.add(getattr(arg, "run_in", "run"))
-        if isinstance(result, DefaultResult):
-            value = result.value
-        elif not isinstance(result, Result):
+        run_in = getattr(arg, "run_in", "run")
+        if run_in != "run":
+            if method is None:
+                method = run_in
+            elif method != run_in:
+                raise ValueError(
+                    "ambiguous method to execute: possibilities are "
+                    f"{method!r} and {run_in!r}"
+                )
+
+        if not isinstance(result, (Result, DefaultResult)):
             continue
-        else:
-            value = result.portion
 
-        custom = getattr(arg, "add_to_namespace", None)
-        if custom:
+        # Arguments usually add their own value; the portion of
+        # the string is only extracted when they don't.
+        if custom := getattr(arg, "add_to_namespace", None):
             custom(result, namespace)
+        elif isinstance(result, DefaultResult):
+            setattr(namespace, arg.dest, result.value)
         else:
-            setattr(namespace, arg.dest, value)
+            setattr(namespace, arg.dest, result.portion)
 
-    methods.discard("run")
-    if len(methods) > 1:
-        raise ValueError(
-            f"ambiguous method to execute: possibilities are {methods}"
-        )
-    elif methods:
-        setattr(namespace, "_run_in", methods.pop())
+    if method is not None:
+        namespace._run_in = method
 
     return namespace
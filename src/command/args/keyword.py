@@ -48,6 +48,8 @@ class Keyword(Argument):
     def __init__(self, *names, dest, optional=False, default=None):
         super().__init__(dest, optional=optional, default=default)
         self.names = names
+        self._forms = tuple((f"{name} ", f" {name} ") for name in names)
+        self._leading = tuple(leading for leading, _ in self._forms)
         self.msg_cannot_find = "Can't find this argument."
 
     def __repr__(self):
@@ -85,19 +87,24 @@ class Keyword(Argument):
             result (Result or ArgumentError).
 
         """
-        for name in self.names:
-            if string[begin:].startswith(f"{name} "):
+        end = len(string) if end is None else end
+
+        # Check all the leading forms at once, before testing each name.
+        starts = string.startswith(self._leading, begin)
+        for leading, middle in self._forms:
+            if starts and string.startswith(leading, begin):
                 return Result(
                     begin=begin,
-                    end=begin + len(name) + 1,
+                    end=begin + len(leading),
                     string=string,
                 )
 
-            pos = string.find(f" {name} ", begin)
-            if pos >= 0 and pos < end:
+            # The middle form has to start before the end.
+            pos = string.find(middle, begin, end + len(middle) - 1)
+            if pos >= 0:
                 return Result(
                     begin=pos,
-                    end=pos + len(name) + 2,
+                    end=pos + len(middle),
                     string=string,
                 )
 
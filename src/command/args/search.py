@@ -60,6 +60,67 @@ class Search(Argument):
     def __repr__(self):
         return "<Search arg>"
 
+    @property
+    def search_in(self):
+        """Return where to search (a location name or callable)."""
+        return self._search_in
+
+    @search_in.setter
+    def search_in(self, search_in):
+        """Change where to search, resolving the locations right away.
+
+        Raises:
+            ValueError: a location is neither a known name nor a callable.
+
+        """
+        self._search_in = search_in
+        self._resolvers = None
+        if search_in is not None:
+            self._build_resolvers()
+
+    @property
+    def resolvers(self):
+        """Return the callables to get the nodes to search in.
+
+        They are computed from `search_in` once and then cached.
+
+        Raises:
+            ValueError: a location is neither a known name nor a callable.
+
+        """
+        resolvers = self._resolvers
+        if resolvers is None:
+            resolvers = self._build_resolvers()
+
+        return resolvers
+
+    def _build_resolvers(self) -> tuple:
+        """Resolve `search_in` into callables and cache them.
+
+        Raises:
+            ValueError: a location is neither a known name nor a callable.
+
+        """
+        search_in = self._search_in
+        if not isinstance(search_in, (list, tuple)):
+            search_in = (search_in,)
+
+        resolvers = []
+        for term in search_in:
+            term = LOCATIONS.get(term, term)
+            if not callable(term):
+                raise ValueError(
+                    f"search_in: unknown value {term!r}.  This is not "
+                    "part of the supported strings "
+                    f"({list(LOCATIONS.keys())}) and it is not a "
+                    "callable either"
+                )
+
+            resolvers.append(term)
+
+        resolvers = self._resolvers = tuple(resolvers)
+        return resolvers
+
     def parse(
         self,
         character: "Character",
@@ -81,40 +142,26 @@ class Search(Argument):
         """
         end = len(string) if end is None else end
         attempt = string[begin:end]
+        search = attempt.strip()
 
         # Return an error if the argument is mandatory.
-        if not attempt.strip():
+        if not search:
             if not self.optional:
                 return ArgumentError(self.msg_mandatory)
 
         # Try searching for the result with this name.
-        search_in = self.search_in
-        search_in = (
-            isinstance(search_in, (list, tuple)) and search_in or [search_in]
-        )
         nodes = []
-        for term in search_in:
-            node = None
-            term = LOCATIONS.get(term, term)
-            if callable(term):
-                node = term(character)
-            else:
-                raise ValueError(
-                    f"search_in: unknown value {term!r}.  This is not part "
-                    f"of the supported strings ({list(LOCATIONS.keys())}) "
-                    "and it is not a callable either"
-                )
-
-            if node is not None:
+        for resolver in self.resolvers:
+            if (node := resolver(character)) is not None:
                 nodes.append(node)
 
         matches = []
-        if search := attempt.strip():
+        if search:
             group = Group.get_for(character, *nodes)
             matches = group.match(search)
 
         if not matches:
-            if attempt.strip():
+            if search:
                 return ArgumentError(
                     self.msg_cannot_find.format(search=attempt)
                 )
@@ -33,6 +33,7 @@ This argument consists of one or more characters as delimiters.
 
 """
 
+import re
 from typing import Any, Optional, Union, TYPE_CHECKING
 
 from command.args.base import ArgSpace, Argument
@@ -61,6 +62,7 @@ class Symbols(Argument):
     ):
         super().__init__(optional=optional, default=default, **kwargs)
         self.symbols = symbols
+        self._pattern = re.compile(rf"\s*{re.escape(symbols)}\s*")
         self.dests = dests
         self.msg_absent = "You forgot to specify {symbols}."
 
@@ -99,21 +101,9 @@ class Symbols(Argument):
             result (Result or ArgumentError).
 
         """
-        before_pos = string.find(self.symbols, begin)
-        if before_pos != -1:
-            after_pos = before_pos + len(self.symbols)
-            while before_pos > 1 and string[before_pos - 1].isspace():
-                before_pos -= 1
-            if after_pos == -1:
-                after_pos = None
-            else:
-                while (
-                    after_pos < len(string) - 2
-                    and string[after_pos + 1].isspace()
-                ):
-                    after_pos += 1
-
-            return Result(begin=before_pos, end=after_pos, string=string)
+        end = len(string) if end is None else end
+        if match := self._pattern.search(string, begin, end):
+            return Result(begin=match.start(), end=match.end(), string=string)
 
         return ArgumentError(self.msg_absent.format(symbols=self.symbols))
 
@@ -32,9 +32,9 @@
 from importlib import import_module
 import inspect
 from pathlib import Path
-from textwrap import dedent
 import traceback
 from typing import Any, Dict, Sequence, Type, TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from command.abc import CommandMetaclass
 from command.args import ArgumentError, CommandArgs, Namespace
@@ -48,6 +48,12 @@ if TYPE_CHECKING:
 
 _NOT_SET = object()
 
+# Values found in command packages, cached by path and names.
+_EXPLORED: dict[tuple[Path, tuple[str, ...]], tuple[Any, ...]] = {}
+
+# Parameters of the run methods, cached by function.
+_PARAMETERS: WeakKeyDictionary = WeakKeyDictionary()
+
 
 class Command(metaclass=CommandMetaclass):
 
@@ -154,10 +160,13 @@ class Command(metaclass=CommandMetaclass):
     service: BaseService
     sub_commands: set["Command"] = set()
 
+    __slots__ = ("character", "sep", "arguments", "_db")
+
     def __init__(self, character=None, sep=None, arguments=""):
         self.character = character
         self.sep = sep
         self.arguments = arguments
+        self._db = None
 
     @property
     def session(self):
@@ -165,8 +174,16 @@ class Command(metaclass=CommandMetaclass):
 
     @property
     def db(self):
-        """Return the ProxyNamespace for this command."""
-        return ProxyNamespace(self)
+        """Return the ProxyNamespace for this command.
+
+        The proxy is created on first access and kept for the
+        lifetime of the command.
+
+        """
+        if (db := self._db) is None:
+            db = self._db = ProxyNamespace(self)
+
+        return db
 
     @classmethod
     def can_run(cls, character) -> bool:
@@ -212,8 +229,7 @@ class Command(metaclass=CommandMetaclass):
             help (str): the command help as a str.
 
         """
-        docstring = inspect.getdoc(cls)
-        return dedent(docstring)
+        return cls.help_text
 
     @classmethod
     def new_parser(self) -> CommandArgs:
@@ -302,15 +318,15 @@ class Command(metaclass=CommandMetaclass):
             "",
         ]
 
-        max_name = max(len(cls.name) for cls in type(self).sub_commands)
-        for sub in type(self).sub_commands:
+        cls = type(self)
+        max_name = cls.sub_commands_width
+        limit = 72 - max_name
+        for sub in cls.iter_sub_commands:
             if not sub.can_run(self.character):
                 continue
 
             name = sub.name
-            synopsis = sub.get_help(self.character)
-            synopsis = synopsis.splitlines()[0]
-            limit = 72 - max_name
+            synopsis = sub.get_help(self.character).partition("\n")[0]
             if len(synopsis) > limit:
                 synopsis = synopsis[:limit] + "..."
             lines.append(f"  {name:<{max_name}} - {synopsis}")
@@ -340,57 +356,71 @@ class Command(metaclass=CommandMetaclass):
             path (pathlib.Path): path leading to the command.
 
         """
+        # Only values defined on the class itself are kept.
+        defined = cls.__dict__
+
         # Try to find the command name
-        if not hasattr(cls, "name"):
+        if "name" not in defined:
             cls.name = cls.__name__.lower()
 
         # Try to find the command category, permissions and layer
-        if any(
-            not hasattr(cls, missing)
-            for missing in ("category", "permissions")
-        ):
+        if "category" not in defined or "permissions" not in defined:
             category, permissions = cls._explore_for(
                 path, ("CATEGORY", "PERMISSIONS")
             )
 
-            if not hasattr(cls, "category"):
+            if "category" not in defined:
                 category = category or "General"
                 cls.category = category
 
-            if not hasattr(cls, "permissions"):
+            if "permissions" not in defined:
                 permissions = permissions or ""
                 cls.permissions = permissions
 
     @staticmethod
     def _explore_for(path: Path, names: Sequence[str]):
         """Explore for the given variable names."""
-        values = [_NOT_SET] * len(names)
-        current = path
-        while str(current) != ".":
-            if current.parts[-1].endswith(".py"):
-                current = current.parent / current.stem
+        values = Command._explore_module(path, tuple(names))
+        return tuple(None if value is _NOT_SET else value for value in values)
+
+    @staticmethod
+    def _explore_module(path: Path, names: tuple[str, ...]):
+        """Explore a module and its parents for the given variable names.
 
-            pypath = ".".join(current.parts)
-            module = import_module(pypath)
-            for i, name in enumerate(names):
-                if values[i] is not _NOT_SET:
-                    continue
+        The values found for a path are cached, so each parent package
+        is only explored once, however many commands it contains.
 
-                value = getattr(module, name, _NOT_SET)
-                if value is not _NOT_SET:
-                    values[i] = value
+        Args:
+            path (Path): the path of the module or package.
+            names (tuple of str): the variable names.
 
-            if not any(value is _NOT_SET for value in values):
-                return tuple(values)
+        Returns:
+            values (tuple): the found values, `_NOT_SET` if not found.
 
-            current = current.parent
+        """
+        if str(path) == ".":
+            return (_NOT_SET,) * len(names)
 
-        # Some values couldn't be found in parent directories.
-        for i, value in enumerate(values):
-            if value is _NOT_SET:
-                values[i] = None
+        values = _EXPLORED.get((path, names))
+        if values is None:
+            current = path
+            if current.parts[-1].endswith(".py"):
+                current = current.parent / current.stem
 
-        return tuple(values)
+            module = import_module(".".join(current.parts))
+            values = tuple(getattr(module, name, _NOT_SET) for name in names)
+
+            # Look in parent directories for the missing values.
+            if any(value is _NOT_SET for value in values):
+                parents = Command._explore_module(current.parent, names)
+                values = tuple(
+                    parent if value is _NOT_SET else value
+                    for value, parent in zip(values, parents)
+                )
+
+            _EXPLORED[(path, names)] = values
+
+        return values
 
     @classmethod
     def args_to_dict(cls, method, args: Namespace) -> Dict[str, Any]:
@@ -408,10 +438,13 @@ class Command(metaclass=CommandMetaclass):
 
         """
         to_dict = {}
-        signature = inspect.signature(method)
-        parameters = [
-            p for p in signature.parameters.values() if p.name != "self"
-        ]
+        function = getattr(method, "__func__", method)
+        parameters = _PARAMETERS.get(function)
+        if parameters is None:
+            signature = inspect.signature(method)
+            parameters = _PARAMETERS[function] = tuple(
+                p for p in signature.parameters.values() if p.name != "self"
+            )
 
         for parameter in parameters:
             if parameter.name == "args":
@@ -74,12 +74,13 @@ class Add(Command):
 
     def run(self, direction: str, title: str, barcode: str | None):
         """Run the command."""
-        try:
-            direction = Direction.from_name(direction)
-        except ValueError:
+        found = Direction.get_by_name(direction)
+        if found is None:
             self.msg(f"The direction {direction!r} cannot be found.")
             return
 
+        direction = found
+
         room = self.character.location
         if room.exits.has(direction):
             self.msg(
@@ -27,8 +27,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED
 # OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from collections import defaultdict
-
 from command import Command
 from tools.list import ListView
 
@@ -53,21 +51,15 @@ class Help(Command):
 
     def run(self, name):
         """Run the command."""
-        commands = Command.service.commands
-        commands = {
-            command.full_name: command
-            for command in commands.values()
-            if command.in_help
-        }
-        if character := self.character:
-            commands = {
-                cmd_name: command
-                for cmd_name, command in commands.items()
-                if command.can_run(character)
-            }
+        character = self.character
 
+        # Permissions are only checked on the commands to display.
         if name:
-            command = commands.get(name.lower())
+            command = Command.service.help_commands.get(name.lower())
+            if command is not None and character:
+                if not command.can_run(character):
+                    command = None
+
             if command is None:
                 self.msg(f"Cannot find this command: '{name}'.")
             else:
@@ -79,16 +71,13 @@ class Help(Command):
         else:
             view = ListView(orientation=ListView.HORIZONTAL)
             view.items.indent_width = 4
-            categories = defaultdict(list)
-            for command in commands.values():
-                if command.parent:
-                    continue
-
-                categories[command.category].append(command)
-
-            for category, commands in sorted(categories.items()):
-                view.add_section(
-                    category, [command.name for command in commands]
-                )
+            for category, commands in Command.service.help_categories:
+                names = [
+                    command.name
+                    for command in commands
+                    if not character or command.can_run(character)
+                ]
+                if names:
+                    view.add_section(category, names)
 
             self.msg(view.render())
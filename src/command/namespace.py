@@ -35,6 +35,7 @@ This is used to store persistent data on the command for this character.
 
 """
 
+from sys import intern
 from typing import Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -42,32 +43,42 @@ if TYPE_CHECKING:
 
 _NOT_SET = object()
 
+# Transformed keys, by prefix and key, shared by all proxies.
+_KEYS: dict[str, dict[str, str]] = {}
+
 
 class ProxyNamespace:
 
     """Proxy namespace, accessible through `command.db`."""
 
+    __slots__ = ("_command", "_character", "_prefix", "_keys")
+
     def __init__(self, command: "Command"):
         self._command = command
         self._character = command.character
+        self._prefix = type(command).db_prefix
+        self._keys = _KEYS.setdefault(self._prefix, {})
 
     def __getattr__(self, key: str) -> Any:
-        if key in ("_command", "_character"):
-            return object.__getattr__(self, key)
+        if key in ("_command", "_character", "_prefix", "_keys"):
+            raise AttributeError(key)
+
+        try:
+            value = self._character.db[self._transform_key(key)]
+        except KeyError:
+            raise AttributeError(key) from None
 
-        key = self._transform_key(key)
-        value = self._character.dd[key]
         return value
 
     def __setattr__(self, key: str, value: Any):
-        if key in ("_command", "_character"):
+        if key in ("_command", "_character", "_prefix", "_keys"):
             object.__setattr__(self, key, value)
         else:
             key = self._transform_key(key)
             self._character.db[key] = value
 
     def __delattr__(self, key: str):
-        if key in ("_command", "_character"):
+        if key in ("_command", "_character", "_prefix", "_keys"):
             object.__delattr__(self, key)
         else:
             key = self._transform_key(key)
@@ -88,10 +99,9 @@ class ProxyNamespace:
 
     def clear(self):
         """Clear the command attributes."""
-        cmd_key = self._transform_key("")
-        for key in tuple(self._character.db.keys()):
-            if key.startswith(cmd_key):
-                del self._character.db[key]
+        cmd_key = self._prefix
+        db = self._character.db
+        db.remove_keys([key for key in db.keys() if key.startswith(cmd_key)])
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """Get the key or a default value.
@@ -118,13 +128,13 @@ class ProxyNamespace:
 
     def popitem(self) -> Tuple[str, Any]:
         """Remove and return the last pair (key, value)."""
-        cmd_key = self._transform_key("")
-        keys = [
-            key for key in self._character.db.keys() if key.startswith(cmd_key)
-        ]
-        if keys:
-            key = keys[-1]
-            return self._character.db.pop(key)
+        cmd_key = self._prefix
+        db = self._character.db
+
+        # Search from the end, the last key of this command is popped.
+        for key in reversed(db.keys()):
+            if key.startswith(cmd_key):
+                return db.pop(key)
 
         raise KeyError("empty namespace")
 
@@ -144,17 +154,23 @@ class ProxyNamespace:
 
     def update(self, *args, **kwargs):
         """Update the namespace."""
-        cmd_key = self._transform_key("")
-        keys = dict(*args, **kwargs)
-        to_update = {}
-        for key, value in keys.items():
-            key = cmd_key + key
-            to_update[key] = value
-        self._character.db.update(to_update)
+        cmd_key = self._prefix
+        self._character.db.update(
+            {
+                cmd_key + key: value
+                for key, value in dict(*args, **kwargs).items()
+            }
+        )
 
     def _transform_key(self, key: str) -> str:
-        """Transform the key in a valid attribute name."""
-        transformed = "_command_"
-        transformed += type(self._command).pyname.replace(".", "_")
-        transformed += f"_{key}"
+        """Transform the key in a valid attribute name.
+
+        Transformed keys are interned and cached, so the same string
+        (with its hash already computed) is used for every access.
+
+        """
+        transformed = self._keys.get(key)
+        if transformed is None:
+            transformed = self._keys[key] = intern(self._prefix + key)
+
         return transformed
@@ -38,13 +38,25 @@ class ChannelCommand(Command):
 
     can_shorten = False
 
+    __slots__ = ()
+
     @classmethod
     def get_help(cls, character=None):
-        """Return the help for this command."""
-        return (
-            super()
-            .get_help(character)
-            .format(
-                channel=cls.channel.name, description=cls.channel.description
+        """Return the help for this command.
+
+        The help is formatted with the channel name and description,
+        then cached on the class until either of them changes.
+
+        """
+        channel = cls.channel
+        key = (channel.name, channel.description)
+        cached = cls.__dict__.get("_channel_help")
+        if cached is None or cached[0] != key:
+            text = (
+                super()
+                .get_help(character)
+                .format(channel=channel.name, description=channel.description)
             )
-        )
+            cached = cls._channel_help = (key, text)
+
+        return cached[1]
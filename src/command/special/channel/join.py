@@ -48,14 +48,16 @@ class JoinChannel(ChannelCommand):
     category = "Channels"
     in_help = False
 
+    __slots__ = ()
+
     def run(self):
         """Join the channel."""
         character = self.character
         channel = self.channel
-        if character in channel.subscribers:
+        if channel.has_subscriber(character):
             self.msg(
                 f"You are already connected to the {channel.name} channel."
             )
         else:
-            channel.subscribers.add(character)
+            channel.add_subscriber(character)
             self.msg(f"You now are connected to the {channel.name} channel.")
@@ -46,14 +46,16 @@ class LeaveChannel(ChannelCommand):
     category = "Channels"
     in_help = False
 
+    __slots__ = ()
+
     def run(self):
         """Join the channel."""
         character = self.character
         channel = self.channel
-        if character not in channel.subscribers:
+        if not channel.has_subscriber(character):
             self.msg(f"You are not connected to the {channel.name} channel.")
         else:
-            channel.subscribers.discard(character)
+            channel.remove_subscriber(character)
             self.msg(
                 f"You now are disconnected from the {channel.name} channel."
             )
@@ -50,6 +50,8 @@ class UseChannel(ChannelCommand):
     args = ChannelCommand.new_parser()
     args.add_argument("text", dest="message")
 
+    __slots__ = ()
+
     @classmethod
     def can_run(cls, character) -> bool:
         """Can the command be run by the specified character?
@@ -58,7 +60,7 @@ class UseChannel(ChannelCommand):
             character (Character): the character to run this command.
 
         """
-        return character in cls.channel.subscribers
+        return cls.channel.has_subscriber(character)
 
     def run(self, message):
         """Join the channel."""
@@ -30,8 +30,10 @@
 """Display a Python console for administrators."""
 
 from code import InteractiveConsole
+from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
 import sys
+from typing import Any
 
 from context.base import Context
 from tools.picklable import picklable_dict
@@ -61,15 +63,53 @@ class Py(Context):
         self.buffer = ""
         self.console = None
         self.completed = True
+        self._out = StringIO()
+        self._injected = {}
+        self._variables = None
+
+    # Attributes to pickle (the console itself is rebuilt when needed).
+    _state = ("_session", "_character", "options", "buffer", "completed")
 
     def __getstate__(self):
-        state = dict(self.__dict__)
-        state.pop("console", None)
-        variables = dict(state["options"].get("variables", {}))
-        variables.pop("__builtins__", None)
-        state["options"]["variables"] = picklable_dict(variables)
+        state = {key: getattr(self, key) for key in self._state}
+
+        # Variables only change when a line is executed.
+        if (variables := self._variables) is None:
+            variables = self._variables = picklable_dict(
+                self._user_variables()
+            )
+
+        state["options"] = dict(self.options)
+        state["options"]["variables"] = variables
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.console = None
+        self._out = StringIO()
+        self._injected = {}
+        self._variables = None
+
+    def _user_variables(self) -> dict[str, Any]:
+        """Return the variables created by the user in the console.
+
+        Variables injected when the console was created (`self` and
+        the service locals) are left out, unless the user rebound them.
+
+        """
+        if (console := self.console) is None:
+            variables = dict(self.options.get("variables", {}))
+        else:
+            injected = self._injected
+            variables = {
+                key: value
+                for key, value in console.locals.items()
+                if key not in injected or injected[key] is not value
+            }
+
+        variables.pop("__builtins__", None)
+        return variables
+
     def greet(self) -> str:
         """Return the text when greeting the character in this context."""
         return self.text.format(version=sys.version, platform=sys.platform)
@@ -90,36 +130,42 @@ class Py(Context):
     def other_input(self, line: str):
         """Handle user input."""
         # Create a console, if there's none.
-        if getattr(self, "console", None) is None:
-            variables = self.options.get("variables", {})
-            variables["self"] = self.character
-            variables.update(type(self).service.parent.console.locals)
-            self.console = InteractiveConsole(variables)
-            # Push the buffer.
-            self.console.push(self.buffer)
+        if (console := self.console) is None:
+            # Injected variables are available but not persisted.
+            injected = {"self": self.character}
+            injected.update(type(self).service.parent.console.locals)
+            variables = dict(self.options.get("variables", {}))
+            variables.update(injected)
+            console = self.console = InteractiveConsole(variables)
+            self._injected = injected
+            self._variables = None
+
+            # Push the pending lines, if any.
+            if self.buffer:
+                console.push(self.buffer)
 
         if self.buffer:
             self.buffer += "\n"
         self.buffer += line
 
-        # Wrap the standard output and error in a StringIO.
-        out = StringIO()
-        stdout, stderr = sys.stdout, sys.stderr
-        sys.stdout = out
-        sys.stderr = out
+        # Wrap the standard output and error in a StringIO,
+        # reused from one line to the next.
+        out = self._out
+        out.seek(0)
+        out.truncate()
 
         # Try to execute the line.
         self.completed = True
-        more = self.console.push(line)
-        sys.stdout = stdout
-        sys.stderr = stderr
+        with redirect_stdout(out), redirect_stderr(out):
+            more = console.push(line)
+
         if more:
             self.completed = False
         else:
             self.buffer = ""
+            self._variables = None
 
-        out.seek(0)
-        self.msg(f"{out.read()}")
+        self.msg(out.getvalue())
         self.character.contexts.save()
 
         return True
@@ -152,6 +152,31 @@ class Context:
     }
     hide_input = False
 
+    # Input methods by command name, and whether
+    # input methods expect arguments, by method name.
+    _input_methods: dict[str, str] = {}
+    _input_arity: dict[str, bool] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if isinstance(text := cls.__dict__.get("text"), str):
+            cls.text = dedent(text.strip("\n"))
+
+        cls._input_methods = {
+            name[6:]: name
+            for name in dir(cls)
+            if name.startswith("input_")
+        }
+        names = set(cls.inputs.values())
+        names.update(cls._input_methods.values())
+        arity = {}
+        for name in names:
+            func = getattr(cls, name, None)
+            if callable(func):
+                arity[name] = len(inspect.signature(func).parameters) > 1
+
+        cls._input_arity = arity
+
     def __init__(
         self,
         session: Optional["Session"] = None,
@@ -225,7 +250,8 @@ class Context:
         """Refresh the context view."""
         text = self.greet()
         if text is not None:
-            if isinstance(text, str):
+            # The class text is dedented when the class is created.
+            if isinstance(text, str) and text is not type(self).text:
                 text = dedent(text.strip("\n"))
             self.msg(text)
 
@@ -296,15 +322,13 @@ class Context:
             user_input (str): the user input.
 
         """
-        if " " in user_input:
-            command, args = user_input.split(" ", 1)
-        else:
-            command, args = user_input, ""
+        cls = type(self)
+        command, _, args = user_input.partition(" ")
 
         # Look for an input methods.
         method = None
         if user_input:
-            method_name = type(self).inputs.get(command or user_input)
+            method_name = cls.inputs.get(command or user_input)
             if method_name:
                 method = getattr(self, method_name, None)
         else:
@@ -312,23 +336,26 @@ class Context:
 
         if method is None:
             # Try to find an input_{command} method
-            method = getattr(self, f"input_{command.lower()}", None)
+            if method_name := cls._input_methods.get(command.lower()):
+                method = getattr(self, method_name, None)
 
         if method:
             # Pass the command argument if the method signature asks for it.
-            signature = inspect.signature(method)
-            if len(signature.parameters) == 0:
-                method_args = ()
-            else:
-                method_args = (args,)
+            wants_args = cls._input_arity.get(method.__name__)
+            if wants_args is None:
+                func = getattr(method, "__func__", method)
+                wants_args = func.__code__.co_argcount > 1
+
+            method_args = (args,) if wants_args else ()
         else:
             method = self.other_input
             method_args = (user_input,)
 
         try:
             res = method(*method_args)
-        except Exception:
-            self.msg(traceback.format_exc())
+        except Exception as err:
+            # The full traceback is only logged.
+            self.msg("".join(traceback.format_exception_only(type(err), err)))
             logger.exception("An error occurred while running the context:")
             raise
 
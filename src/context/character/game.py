@@ -48,11 +48,18 @@ Note:
 
 """
 
+from typing import Iterable, Mapping
+
 from dynaconf import settings
 
 from command.base import Command
 from context.base import Context
 
+# Names of the global commands, cached by parent and runnable commands.
+# Exit commands are specific to a room and are never cached here.
+_NAMES: dict[tuple, dict[str, Command]] = {}
+_NAMES_LIMIT = 1024
+
 
 class Game(Context):
 
@@ -73,79 +80,58 @@ class Game(Context):
     def handle_input(self, user_input: str):
         """Route the user input to the context stack."""
         character = self.character
-        commands = []
 
-        # Add exit commands (specific to the room).
-        if (room := character.location) is not None:
-            if (exits := getattr(room, "exits", None)) is not None:
-                commands = list(exits.get_commands_for(character).values())
+        # All commands (non-specific to location).
+        root = commands = Command.service.all_commands
 
-        # Add all other commands (non-specific to location).
-        commands += list(Command.service.commands.values())
+        # Exit commands (specific to the room).
+        exit_commands = ()
+        if (room := character.location) is not None:
+            if (handler := getattr(room, "exits", None)) is not None:
+                exit_commands = handler.get_commands_for(character).values()
 
-        root = commands
         parent = command = method = None
         while commands:
-            names = {}
             commands = {
                 cls
                 for cls in commands
                 if cls.parent is parent and cls.can_run(character)
             }
-            seps = {sep: () for comm in commands for sep in comm.seps}
-            for sep in seps.keys():
-                try:
-                    before, after = user_input.split(sep, 1)
-                except ValueError:
-                    before, after = user_input, ""
-
-                seps[sep] = (before, after)
-
-            # Create a dictionary (hashed structure) to access command names.
-            for cls in commands:
-                record_names(names, cls.name, cls)
-
-                # Add aliases.
-                if alias := cls.alias:
-                    if isinstance(alias, str):
-                        aliases = (alias,)
-                    else:
-                        aliases = alias
-
-                    for alias in aliases:
-                        record_names(names, alias, cls)
-
-            # Add global aliases if theree's no parent.
+
+            # Add exits and global aliases if there's no parent.
+            exits = ()
+            sub_commands = []
             if parent is None:
+                exits = [
+                    cls for cls in exit_commands if cls.can_run(character)
+                ]
                 sub_commands = [
                     cls
                     for cls in root
                     if cls.parent is not None and cls.can_run(character)
                 ]
-                for cls in sub_commands:
-                    if alias := cls.global_alias:
-                        if isinstance(alias, str):
-                            aliases = (alias,)
-                        else:
-                            aliases = alias
 
-                        for alias in aliases:
-                            record_names(names, alias, cls)
+            # If no sub-command can be run, run the parent command.
+            if not commands and not exits:
+                break
+
+            names = get_names(parent, commands, sub_commands)
+            if exits:
+                names = add_exit_names(names, exits)
+                commands = (*exits, *commands)
 
             # We have a dictionary containing completion commands names.
             # We then try to match the command using different separators.
-            for before, after in seps.values():
-                command = names.get(before, None)
-                if command is not None:
-                    parent = command
-                    commands = command.sub_commands
-                    user_input = after
-                    break
-
-            if command is None:
+            match = match_command(names, commands, user_input)
+            if match is None:
                 command = parent
                 method = "display_sub_commands"
-                commands = None
+                break
+
+            command, sep, after = match
+            parent = command
+            commands = command.iter_sub_commands
+            user_input = after
 
         found = False
         if command:
@@ -164,6 +150,115 @@ class Game(Context):
         return f"Command introuvable : {user_input}"
 
 
+def get_names(
+    parent: Command | None,
+    commands: set[Command],
+    sub_commands: list[Command],
+) -> dict[str, Command]:
+    """Return the dictionary of names to access commands.
+
+    Names are cached for a given parent and set of commands,
+    since building them (with all shortened names) is costly
+    and the same commands are usually available from one input
+    to the next.
+
+    Args:
+        parent (Command or None): the parent command, if any.
+        commands (set of Command): the commands that can be run.
+        sub_commands (list of Command): the sub-commands that can
+                be run, to add their global aliases.
+
+    Returns:
+        names (dict): the names, do not modify this dictionary.
+
+    """
+    key = (parent, frozenset(commands), frozenset(sub_commands))
+    names = _NAMES.get(key)
+    if names is None:
+        # Create a dictionary (hashed structure) to access command names.
+        names = {}
+        for cls in commands:
+            record_names(names, cls.name, cls)
+
+            # Add aliases.
+            for alias in cls._aliases:
+                record_names(names, alias, cls)
+
+        # Add global aliases.
+        for cls in sub_commands:
+            for alias in cls._global_aliases:
+                record_names(names, alias, cls)
+
+        if len(_NAMES) >= _NAMES_LIMIT:
+            _NAMES.clear()
+
+        _NAMES[key] = names
+
+    return names
+
+
+def add_exit_names(
+    names: dict[str, Command], exits: Iterable[Command]
+) -> dict[str, Command]:
+    """Return a copy of the names with the exit commands added.
+
+    Exit commands are specific to a room, so their names are
+    added on every input.  There are usually only a few of them.
+    Like other names, full names and aliases replace the existing
+    entries, while shortcuts only fill names that are still free.
+
+    Args:
+        names (dict): the cached names, as returned by `get_names`.
+        exits (iterable of Command): the exit commands that can be run.
+
+    Returns:
+        names (dict): a new dictionary with the exit names.
+
+    """
+    names = dict(names)
+    for cls in exits:
+        record_names(names, cls.name, cls)
+        for alias in cls._aliases:
+            record_names(names, alias, cls)
+
+    return names
+
+
+def match_command(
+    names: Mapping[str, Command], commands: Iterable[Command], user_input: str
+) -> tuple[Command, str, str] | None:
+    """Match the user input against command names.
+
+    The user input is split once for each separator used
+    by these commands, longer separators first, stopping at
+    the first match.  A name only matches with one of its own
+    command's separators.
+
+    Args:
+        names (mapping): the command names, as returned by `get_names`.
+        commands (iterable of Command): the commands that can be run.
+        user_input (str): the user input.
+
+    Returns:
+        (command, sep, after): the matched command, the separator
+                used and the remaining input, or `None` if no
+                command matches.
+
+    """
+    seps = {sep for cls in commands for sep in cls._seps}
+    for sep in sorted(seps, key=lambda sep: (-len(sep), sep)):
+        if sep:
+            before, _, after = user_input.partition(sep)
+        else:
+            before, after = user_input, ""
+
+        command = names.get(before)
+        if command is not None and sep in command._seps:
+            return command, sep, after
+
+    return None
+
+
 def can_shorten(command: Command) -> bool:
     """Can this command be shortened, using aliases?"""
     return settings.CAN_SHORTEN_COMMANDS and command.can_shorten
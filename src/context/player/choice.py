@@ -59,16 +59,12 @@ class Choice(Context):
         lines = [
             f"Welcome to your account, {account.username}!",
             "Please enter one of the following choices:",
-        ]
-
-        i = 1
-        for player in account.players:
-            lines.append(
+            *(
                 f"  {i:>2} to connect to the character {player.name}."
-            )
-            i += 1
-
-        lines.append("  C to create a new character in this account.")
+                for i, player in enumerate(account.players, 1)
+            ),
+            "  C to create a new character in this account.",
+        ]
         return "\n".join(lines)
 
     def input_c(self):
@@ -77,13 +73,16 @@ class Choice(Context):
 
     def other_input(self, user_input: str):
         """The user entered something else."""
-        account = self.session.db.account
-        i = 1
-        for player in account.players:
-            if user_input == str(i):
-                self.session.db.character = player
-                self.move("player.login")
-                return True
-            i += 1
+        players = self.session.db.account.players
+
+        # Only accept the numbers as displayed (ASCII, no leading zero).
+        i = 0
+        if user_input.isascii() and user_input.isdigit():
+            i = int(user_input)
+
+        if 0 < i <= len(players) and str(i) == user_input:
+            self.session.db.character = players[i - 1]
+            self.move("player.login")
+            return True
 
         self.msg("This is not a valid option.")
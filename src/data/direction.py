@@ -58,6 +58,21 @@ class Direction(Enum):
         """Return the aliases for this direction."""
         return _ALIASES[self]
 
+    @staticmethod
+    def get_by_name(name: str) -> "Direction | None":
+        """Get the direction from a given name, or None.
+
+        Aliases are used to find the proper direction.
+
+        Args:
+            name (str): the direction name (or alias).
+
+        Returns:
+            direction (Direction or None): the direction if found.
+
+        """
+        return _BY_NAME.get(name.lower())
+
     @staticmethod
     def from_name(name: str) -> "Direction":
         """Get the direction from a given name.
@@ -76,15 +91,9 @@ class Direction(Enum):
             ValueError if the name cannot be matched.
 
         """
-        name = name.lower()
-        found = None
-        for direction, aliases in _ALIASES.items():
-            if name in aliases:
-                found = direction
-                break
-
+        found = Direction.get_by_name(name)
         if found is None:
-            raise ValueError(f"cannot find the direction {name!r}")
+            raise ValueError(f"cannot find the direction {name.lower()!r}")
 
         return found
 
@@ -116,3 +125,12 @@ _ALIASES = {
     Direction.DOWN: ("down", "d"),
     Direction.UP: ("up", "u"),
 }
+
+
+# Directions by name or alias.  Aliases are browsed in reverse so that,
+# should two directions share an alias, the first one wins.
+_BY_NAME = {
+    alias: direction
+    for direction, aliases in reversed(_ALIASES.items())
+    for alias in aliases
+}
@@ -29,6 +29,8 @@
 
 """Channel handler, to store channels for a character."""
 
+from typing import Iterable
+
 from channel.base import Channel
 from data.handler.abc import BaseHandler
 
@@ -64,24 +66,13 @@ class ChannelHandler(BaseHandler):
             channel (str or Channel): the channel to add.
 
         """
-        character, _ = self.model
-        if isinstance(channel, str):
-            path = channel
-            channel = Channel.service.channels.get(path)
-            if channel is None:
-                raise ValueError(f"cannot find the channel of path {path!r}")
-        else:
-            path = channel.path
-
-        if path not in self._channels:
-            self._channels.add(path)
-            self.save()
-
-        channel.subscribers.add(character)
+        self.update((channel,))
 
     def clear(self):
         """Remove all channels."""
         if len(self._channels) > 1:
+            for path in self._channels:
+                self._unsubscribe(path)
             self._channels.clear()
             self.save()
 
@@ -99,6 +90,7 @@ class ChannelHandler(BaseHandler):
 
         if path in self._channels:
             self._channels.discard(path)
+            self._unsubscribe(path)
             self.save()
 
     def has(self, channel: str | Channel) -> bool:
@@ -132,4 +124,52 @@ class ChannelHandler(BaseHandler):
 
         if path in self._channels:
             self._channels.remove(path)
+            self._unsubscribe(path)
             self.save()
+
+    def update(self, channels: Iterable[str | Channel]):
+        """Add several channels for this character.
+
+        The handler is saved only once, if at least one channel
+        was added, which avoids a database write per channel
+        when joining several channels at once.
+
+        Args:
+            channels (iterable): the channels (str or Channel) to add.
+
+        """
+        character, _ = self.model
+        modified = False
+        for channel in channels:
+            if isinstance(channel, str):
+                path = channel
+                channel = Channel.service.channels.get(path)
+                if channel is None:
+                    raise ValueError(
+                        f"cannot find the channel of path {path!r}"
+                    )
+            else:
+                path = channel.path
+
+            if path not in self._channels:
+                self._channels.add(path)
+                modified = True
+
+            channel.add_subscriber(character)
+
+        if modified:
+            self.save()
+
+    def _unsubscribe(self, path: str) -> None:
+        """Remove the character from the subscribers of a channel.
+
+        This keeps the channel's subscriber index in sync
+        with the channels of the character.
+
+        Args:
+            path (str): the channel path.
+
+        """
+        character, _ = self.model
+        if (channel := Channel.service.channels.get(path)) is not None:
+            channel.remove_subscriber(character)
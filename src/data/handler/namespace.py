@@ -29,7 +29,7 @@
 
 """Namespace handler to store flexible data."""
 
-from typing import Any
+from typing import Any, Iterable
 
 from data.handler.abc import BaseHandler
 
@@ -116,6 +116,24 @@ class NamespaceHandler(BaseHandler):
         self.save()
         return pair
 
+    def remove_keys(self, keys: Iterable[str]):
+        """Remove several keys, saving the namespace only once.
+
+        Keys that aren't present are ignored.
+
+        Args:
+            keys (iterable of str): the keys to remove.
+
+        """
+        data = self._data
+        removed = False
+        for key in keys:
+            if data.pop(key, _NOT_SET) is not _NOT_SET:
+                removed = True
+
+        if removed:
+            self.save()
+
     def setdefault(self, key, default=None):
         value = self._data.setdefault(key, default)
         self.save()
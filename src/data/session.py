@@ -133,15 +133,16 @@ class Session(Model):
 
         # Place the character in its subscribed channels.
         for channel in character.channels.subscribed:
-            channel.subscribers.add(character)
+            channel.add_subscriber(character)
 
         # Automatically join `always_on` channels.
-        for channel in CHANNELS.values():
-            if not channel.always_on:
-                continue
-
-            if character not in channel.subscribers:
-                character.channels.add(channel)
+        character.channels.update(
+            [
+                channel
+                for channel in CHANNELS.values()
+                if channel.always_on and not channel.has_subscriber(character)
+            ]
+        )
 
     def logout(self):
         """Prepare the session for logout."""
@@ -34,7 +34,7 @@ from collections import defaultdict
 from datetime import datetime
 from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Type, TYPE_CHECKING
 
 from channel.base import Channel
 from channel.log import logger as chn_logger
@@ -46,6 +46,9 @@ from data.session import Session, OUTPUT_QUEUE
 from service.base import BaseService
 from service.list import CHANNELS
 
+if TYPE_CHECKING:
+    from data.character import Character
+
 
 class Service(BaseService):
 
@@ -72,6 +75,9 @@ class Service(BaseService):
         self.output_lock = asyncio.Lock()
         self.contexts = {}
         self.commands = {}
+        self.all_commands = ()
+        self.help_commands = {}
+        self.help_categories = []
         self.channels = CHANNELS
         self.stats = []
 
@@ -80,6 +86,8 @@ class Service(BaseService):
         self.load_contexts()
         self.load_commands()
         self.load_channels()
+        self.index_commands()
+        self.index_help()
 
     async def cleanup(self):
         """Clean the service up before shutting down."""
@@ -232,6 +240,54 @@ class Service(BaseService):
 
         Command.service = self
 
+    def add_commands(self, commands: dict[str, Type[Command]]):
+        """Add commands while the game is running.
+
+        The command indexes (for the game context and help) are
+        rebuilt, so the new commands can be used right away.
+
+        Args:
+            commands (dict): the new commands, by Python path.
+
+        """
+        self.commands.update(commands)
+        self.index_commands()
+        self.index_help()
+
+    def index_commands(self):
+        """Freeze the sequence of all loaded commands.
+
+        This method is called once all commands, including the
+        channel commands, have been loaded, and whenever commands
+        are added later.  The game context iterates over this tuple
+        on every input.
+
+        """
+        self.all_commands = tuple(self.commands.values())
+
+    def index_help(self):
+        """Index the commands to display in help.
+
+        This method is called once all commands, including the
+        channel commands, have been loaded, and whenever commands
+        are added later.  Commands are indexed
+        by lowercase full name and grouped by category (sorted by name).
+        Permissions are checked later, since they depend on the
+        character asking for help.
+
+        """
+        help_commands = {}
+        categories = defaultdict(list)
+        for command in self.commands.values():
+            if command.in_help:
+                help_commands[command.full_name.lower()] = command
+                if not command.parent:
+                    categories[command.category].append(command)
+
+        self.help_commands = help_commands
+
+        self.help_categories = sorted(categories.items())
+
     def load_channels(self):
         """Dynamically load channels."""
         channels = self.dynamically_load(
@@ -273,6 +329,31 @@ class Service(BaseService):
         executed = datetime.utcnow()
         self.record_stat(session, command, sent, received, executed)
 
+    def broadcast(self, pairs: Iterable[tuple["Character", str]]) -> None:
+        """Send messages to several characters at once.
+
+        Each distinct line is encoded only once per session encoding,
+        then queued as bytes.  Output is still grouped per session
+        by `send_output`.
+
+        Args:
+            pairs (iterable): the (character, line) pairs to send.
+
+        """
+        encoded = {}
+        for character, line in pairs:
+            if (session := character.session) is None:
+                continue
+
+            key = (line, session.encoding)
+            text = encoded.get(key)
+            if text is None:
+                text = encoded[key] = line.encode(
+                    session.encoding, errors="replace"
+                )
+
+            session.msg(text)
+
     async def send_output(self, input_id: Optional[int] = None):
         """Send output synchronously."""
         host = self.parent.host
@@ -51,7 +51,7 @@ def picklable_dict(origin: dict[Any, Any]) -> dict[Any, Any]:
     for key, value in origin.items():
         try:
             pickle.dumps((key, value))
-        except TypeError:
+        except (AttributeError, TypeError, pickle.PicklingError):
             pass
         else:
             safe[key] = value
@@ -0,0 +1,127 @@
+from command.args import CommandArgs
+from command.args.helpers import has_entirely_parsed, parse_all
+from command.args.result import Result
+from command.args.text import Text
+from command.args.word import Word
+
+
+def test_several_words():
+    """Parse several words in a row."""
+    args = CommandArgs()
+    args.add_argument("word", dest="first")
+    args.add_argument("word", dest="second")
+    args.add_argument("word", dest="third")
+    result = args.parse(None, "one two three")
+    assert bool(result)
+    assert (result.first, result.second, result.third) == (
+        "one",
+        "two",
+        "three",
+    )
+
+
+def test_number_word_and_text():
+    """Parse arguments of different spaces."""
+    args = CommandArgs()
+    args.add_argument("number")
+    args.add_argument("word")
+    args.add_argument("text")
+    result = args.parse(None, "3 red apples and more")
+    assert bool(result)
+    assert result.number == 3
+    assert result.word == "red"
+    assert result.text == "apples and more"
+
+
+def test_too_many_words():
+    """Extra text is a syntax error."""
+    args = CommandArgs()
+    args.add_argument("word")
+    result = args.parse(None, "one two")
+    assert not bool(result)
+
+
+def test_missing_mandatory_argument():
+    """A missing mandatory argument is an error."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text")
+    result = args.parse(None, "one")
+    assert not bool(result)
+
+
+def test_optional_argument_absent():
+    """An absent optional text is empty."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text", optional=True)
+    result = args.parse(None, "one")
+    assert bool(result)
+    assert result.word == "one"
+    assert result.text == ""
+
+
+def test_optional_argument_present():
+    """A present optional argument is parsed."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text", optional=True)
+    result = args.parse(None, "one two three")
+    assert bool(result)
+    assert result.word == "one"
+    assert result.text == "two three"
+
+
+def test_optional_number_before_text():
+    """An optional number may precede a text."""
+    args = CommandArgs()
+    args.add_argument("number", optional=True)
+    args.add_argument("text")
+    result = args.parse(None, "apples")
+    assert bool(result)
+    assert not hasattr(result, "number")
+    assert result.text == "apples"
+
+    result = args.parse(None, "5 apples")
+    assert bool(result)
+    assert result.number == 5
+    assert result.text == "apples"
+
+
+def test_trailing_whitespace():
+    """Spaces around the arguments are not parsed."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text")
+    result = args.parse(None, "  one   two three  \t")
+    assert bool(result)
+    assert result.word == "one"
+    assert result.text == "two three"
+
+
+def test_single_character_text():
+    """A text of one character followed by spaces is kept."""
+    args = CommandArgs()
+    args.add_argument("text")
+    result = args.parse(None, "a   ")
+    assert bool(result)
+    assert result.text == "a"
+
+
+def test_parse_all_within_bounds():
+    """Only the given portion of the string is parsed."""
+    arguments = [Word("first"), Text("second")]
+    result = parse_all(arguments, None, "skip one two three", 5)
+    assert bool(result)
+    assert result.first == "one"
+    assert result.second == "two three"
+
+
+def test_has_entirely_parsed():
+    """Unparsed positions are only allowed to be spaces."""
+    string = "one two"
+    first = Result(begin=0, end=3, string=string)
+    second = Result(begin=4, end=7, string=string)
+    assert has_entirely_parsed([first, second], string, 0)
+    assert not has_entirely_parsed([first], string, 0)
+    assert has_entirely_parsed([second], string, 4)
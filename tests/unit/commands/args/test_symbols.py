@@ -0,0 +1,76 @@
+from command.args import CommandArgs
+from command.args.symbols import Symbols
+
+
+def test_symbols_consume_surrounding_spaces():
+    """The symbols and the spaces around them are parsed."""
+    arg = Symbols("=", dest="symbols")
+    result = arg.parse(None, "a = b")
+    assert bool(result)
+    assert (result.begin, result.end) == (1, 4)
+
+
+def test_symbols_at_start():
+    """Symbols at the start of the input."""
+    arg = Symbols("=", dest="symbols")
+    result = arg.parse(None, "=b")
+    assert (result.begin, result.end) == (0, 1)
+    result = arg.parse(None, "  = b")
+    assert (result.begin, result.end) == (0, 4)
+
+
+def test_symbols_at_end():
+    """Symbols at the end of the input."""
+    arg = Symbols("=", dest="symbols")
+    result = arg.parse(None, "a =")
+    assert (result.begin, result.end) == (1, 3)
+    result = arg.parse(None, "a= ")
+    assert (result.begin, result.end) == (1, 3)
+
+
+def test_symbols_with_several_characters():
+    """Symbols with more than one character."""
+    arg = Symbols("->", dest="symbols")
+    result = arg.parse(None, "a -> b")
+    assert (result.begin, result.end) == (1, 5)
+    assert result.portion == " -> "
+
+
+def test_symbols_respect_bounds():
+    """Only the given portion of the string is searched."""
+    arg = Symbols("=", dest="symbols")
+    result = arg.parse(None, "a = b = c", 4)
+    assert (result.begin, result.end) == (5, 8)
+    result = arg.parse(None, "a b = c", 0, 3)
+    assert not bool(result)
+
+
+def test_symbols_absent():
+    """An error is returned if the symbols can't be found."""
+    arg = Symbols("=", dest="symbols")
+    result = arg.parse(None, "a b")
+    assert not bool(result)
+    assert str(result) == "You forgot to specify =."
+
+
+def test_symbols_between_arguments():
+    """Symbols separate the arguments around them."""
+    args = CommandArgs()
+    args.add_argument("word", dest="name")
+    args.add_argument("symbols", "=")
+    args.add_argument("text", dest="value")
+    for string in ("key = some value", "key=some value", "key  =  some value"):
+        result = args.parse(None, string)
+        assert bool(result)
+        assert result.name == "key"
+        assert result.value == "some value"
+
+
+def test_symbols_missing_between_arguments():
+    """Without the symbols, the arguments can't be parsed."""
+    args = CommandArgs()
+    args.add_argument("word", dest="name")
+    args.add_argument("symbols", "=")
+    args.add_argument("text", dest="value")
+    result = args.parse(None, "key some value")
+    assert not bool(result)
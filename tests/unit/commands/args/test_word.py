@@ -0,0 +1,32 @@
+from command.args import CommandArgs
+
+
+def test_one_word():
+    """Parse a single word."""
+    args = CommandArgs()
+    args.add_argument("word")
+    result = args.parse(None, "hello")
+    assert bool(result)
+    assert result.word == "hello"
+
+
+def test_word_followed_by_text():
+    """Parse a word followed by text."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text")
+    result = args.parse(None, "hello world and more")
+    assert bool(result)
+    assert result.word == "hello"
+    assert result.text == "world and more"
+
+
+def test_word_separated_by_tab():
+    """A tab also ends a word."""
+    args = CommandArgs()
+    args.add_argument("word")
+    args.add_argument("text")
+    result = args.parse(None, "hello\tworld")
+    assert bool(result)
+    assert result.word == "hello"
+    assert result.text == "world"
@@ -0,0 +1,108 @@
+import pytest
+
+from command.base import Command
+from context.character import game
+from context.character.game import add_exit_names, get_names, match_command
+
+
+class Go(Command):
+
+    """Command with a single, multi-character separator."""
+
+    name = "go"
+    seps = "->"
+
+
+class Short(Command):
+
+    """Command with a short separator."""
+
+    name = "short"
+    seps = (":",)
+
+
+class Long(Command):
+
+    """Command with a longer separator."""
+
+    name = "long"
+    seps = ("::",)
+
+
+class Both(Command):
+
+    """Command with a short and a longer separator."""
+
+    name = "both"
+    seps = (":", "::")
+
+
+def test_seps_as_string():
+    """A string separator is a single separator, not a set of characters."""
+    assert Go._seps == ("->",)
+    result = match_command({"go": Go}, [Go], "go->north")
+    assert result == (Go, "->", "north")
+
+
+def test_seps_belong_to_the_command():
+    """A command only matches with its own separators."""
+    names = {"a": Short}
+    result = match_command(names, [Short, Long], "a::b")
+    assert result == (Short, ":", ":b")
+
+
+def test_seps_longest_first():
+    """A command tries its longer separators first."""
+    names = {"a": Both}
+    result = match_command(names, [Both], "a::b")
+    assert result == (Both, "::", "b")
+
+
+def test_no_match():
+    """None is returned if no name matches."""
+    assert match_command({"go": Go}, [Go], "run->north") is None
+
+
+class Look(Command):
+
+    """Global command whose name is a shortcut of an exit name."""
+
+    name = "look"
+
+
+class Lookout(Command):
+
+    """Exit command."""
+
+    name = "lookout"
+
+
+class Loo(Command):
+
+    """Exit command whose name is a shortcut of a global command."""
+
+    name = "loo"
+
+
+@pytest.fixture
+def shorten(monkeypatch):
+    """Allow to shorten all commands."""
+    monkeypatch.setattr(game, "can_shorten", lambda command: True)
+
+
+def test_exit_shortcuts_do_not_hide_commands(shorten):
+    """Full command names take precedence over exit shortcuts."""
+    names = add_exit_names(get_names(None, {Look}, []), [Lookout])
+    assert names["look"] is Look
+    assert names["l"] is Look
+    assert names["looko"] is Lookout
+    assert names["lookout"] is Lookout
+
+
+def test_exit_names_replace_command_shortcuts(shorten):
+    """Full exit names take precedence over command shortcuts."""
+    cached = get_names(None, {Look}, [])
+    names = add_exit_names(cached, [Loo])
+    assert names["loo"] is Loo
+    assert names["look"] is Look
+    assert cached["loo"] is Look
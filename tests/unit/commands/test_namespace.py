@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+from command.namespace import ProxyNamespace
+
+
+class FakeCommand:
+
+    """Command with a character and a database prefix."""
+
+    db_prefix = "_command_test_"
+
+    def __init__(self):
+        self.character = SimpleNamespace(db={})
+
+
+def test_get_attribute():
+    """Attributes are stored in the character's namespace."""
+    command = FakeCommand()
+    ns = ProxyNamespace(command)
+    ns.value = 5
+    assert ns.value == 5
+    assert command.character.db == {"_command_test_value": 5}
+
+
+def test_missing_attribute():
+    """A missing attribute raises AttributeError, not KeyError."""
+    ns = ProxyNamespace(FakeCommand())
+    assert not hasattr(ns, "missing")
+    assert getattr(ns, "missing", 3) == 3